@@ -7,15 +7,17 @@
 import sys
 
 if __name__ == "__main__":
-    # Check for Python 3.6 or newer
+    # Check for Python 3.8 or newer
     python_version = sys.version_info
     
-    # Init colorama
-    from colorama import init
-    init(autoreset=True)
+    # Init colorama on Windows consoles for ANSI translation, and when
+    # piping so colors are stripped from the output.
+    if (sys.platform == "win32" or not sys.stdout.isatty()) and "--headless" not in sys.argv:
+        from colorama import init
+        init(autoreset=True)
     
-    if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 6):
-        print("Bleeding requires Python 3.6 or newer.")
+    if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 8):
+        print("Bleeding requires Python 3.8 or newer.")
         sys.exit(1)
         
     import bleeding
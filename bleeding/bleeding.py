@@ -1,28 +1,9 @@
 #! /usr/bin/env python3
 import sys
-import click
 from colorama import Fore
-import logger
-
-from modules.enum import enum_services
-from modules.discover import discover, ble_discover
-from modules.deauth import deauth_async
-
-from utils.bt_utils import BTProtocol
-from utils.cli_utils import EnumType
-from utils.mac_utils import random_mac_all_vendors
-from utils.os_utils import get_vcores, is_ble_supported, is_windows
-
-# Constants
-DEFAULT_BT_INTERFACE = "hci0"
-DEFAULT_BT_PROTOCOL = "l2cap"
-DEFAULT_BUFFER_SIZE = 512
-L2CAP_PSM_HCI = 0x1001
-VCORES_COUNT = get_vcores()
 
 # Banner
-def print_banner():
-    print(Fore.RED + """
+BANNER = Fore.RED + """
     ▄▄▄▄    ██▓    ▓█████ ▓█████ ▓█████▄  ██▓ ███▄    █   ▄████ 
     ▓█████▄ ▓██▒    ▓█   ▀ ▓█   ▀ ▒██▀ ██▌▓██▒ ██ ▀█   █  ██▒ ▀█▒
     ▒██▒ ▄██▒██░    ▒███   ▒███   ░██   █▌▒██▒▓██  ▀█ ██▒▒██░▄▄▄░
@@ -35,87 +16,56 @@ def print_banner():
         ░                        ░                             
         
                         Bluetooth/BLE jamming
-          """)
+          """ + Fore.RESET + "\n"
 
-# Main command
-@click.group()
-@click.option("--headless", default=False, is_flag=True, help="Headless mode (No colors and formatting)")
-def main(headless: bool):
-    logger.init_logger(headless)
-    pass
+def print_banner():
+    sys.stdout.write(BANNER)
 
-# Scan command
-@main.command()
-# @click.option("--async", "-a", "is_async", default=False, is_flag=True, help="Scan for devices asynchronously") // ToDo
-@click.option("--ble", "-b", default=False, is_flag=True, help="Scan for BLE devices")
-def scan(ble: bool):
-    mode = "ble" if ble else "default"
-    
-    if ble and not is_ble_supported():
-        logger.err("BLE not supported on this platform")
-        exit(1)
-        
-    match mode:
-        case "default":
-            discover()
-        case "ble":
-            ble_discover()
-        
-# DeAuth command
-@main.command()
-@click.argument("target", required=True, type=str)
-@click.option("--port", "-p", default=L2CAP_PSM_HCI, help="Port to use")
-@click.option("--protocol", "-P", default=DEFAULT_BT_PROTOCOL, help="Port to use",type=EnumType(BTProtocol))
-@click.option("--size", "-s", default=DEFAULT_BUFFER_SIZE, help="Length of packets to send")
-@click.option("--threads", "-t", default=VCORES_COUNT, help="Threads count to use")
-def deauth(target: str, port: int, protocol: BTProtocol, size: int, threads: int):
-    if protocol == BTProtocol.l2cap and is_windows():
-        logger.err("L2CAP protocol is not supported on Windows, please select RFCOMM using -P flag.")
-        exit(1)
-    
-    logger.info("Initializing DeAuth attack...")
-    logger.info(f"  Target:         <lblue>{target}")
-    logger.info(f"  Port:           <lblue>{port}")
-    logger.info(f"  Protocol:       <lblue>{protocol.name}")
-    logger.info(f"  Packet size:    <lblue>{size}")
-    logger.info(f"  Threads:        <lblue>{threads}")
-    deauth_async(target, port, protocol, size, threads)
+# Top level help, printed without loading click.
+# Keep in sync with cli.py: update it whenever a command or group option is added.
+HELP = """Usage: bleeding [OPTIONS] COMMAND [ARGS]...
 
-# Enum command
-@main.command()
-@click.argument("target", required=True, type=str)
-def enum(target: str):
-    enum_services(target)
-    
-# Random MAC
-@main.command()
-def random_mac():
-    logger.info("Generating random MAC addresses...")
-    macs = random_mac_all_vendors()
-    
-    for mac in macs:
-        vendor = mac[0].ljust(10, " ")
-        addr = mac[1]
-        
-        logger.info(f" <lblack>* <reset>{vendor}\t<lgreen>{addr}")
-    
+Options:
+  --headless  Headless mode (No colors and formatting)
+  -h, --help  Show this message and exit.
+
+Commands:
+  deauth
+  enum
+  random-mac
+  scan"""
+HELP_ARGS = ([], ["--help"], ["-h"])
 
 # Start CLI
 def start():
     args = sys.argv[1:]
-    headless = False
+    headless = "--headless" in args
     
-    for _, arg in enumerate(args):
-        if arg == "--headless":
-            headless = True
-            
-    if not headless:
+    # Keep the banner out of pipes and logs.
+    if not headless and sys.stdout.isatty():
         print_banner()
     
+    command = [arg for arg in args if arg != "--headless"]
+    
+    if command in HELP_ARGS:
+        print(HELP)
+        sys.exit(0)
+    
+    # random-mac is purely local, run it without click.
+    if command == ["random-mac"]:
+        import logger
+        from modules.random_mac import random_macs
+        
+        logger.init_logger(headless)
+        random_macs()
+        sys.exit(0)
+    
+    # Only load click and the commands when one is actually run.
+    from cli import main
+    
     try:
         main()
-        exit(0)
     except Exception as e:
         print(f"Error: {e}")
-        exit(1)
+        sys.exit(1)
     
\ No newline at end of file
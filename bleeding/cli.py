@@ -0,0 +1,70 @@
+import click
+import sys
+import logger
+
+from utils.bt_utils import BTProtocol
+from utils.os_utils import get_vcores, is_ble_supported, is_windows
+
+# Constants
+DEFAULT_BT_INTERFACE = "hci0"
+DEFAULT_BT_PROTOCOL = "l2cap"
+DEFAULT_BUFFER_SIZE = 512
+L2CAP_PSM_HCI = 0x1001
+VCORES_COUNT = get_vcores()
+
+# Main command
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option("--headless", default=False, is_flag=True, help="Headless mode (No colors and formatting)")
+def main(headless: bool):
+    logger.init_logger(headless)
+    pass
+
+# Scan command
+@main.command()
+# @click.option("--async", "-a", "is_async", default=False, is_flag=True, help="Scan for devices asynchronously") // ToDo
+@click.option("--ble", "-b", default=False, is_flag=True, help="Scan for BLE devices")
+def scan(ble: bool):
+    if ble and not is_ble_supported():
+        logger.err("BLE not supported on this platform")
+        sys.exit(1)
+        
+    from modules.discover import discover, ble_discover
+    
+    (ble_discover if ble else discover)()
+        
+# DeAuth command
+@main.command()
+@click.argument("target", required=True, type=str)
+@click.option("--port", "-p", default=L2CAP_PSM_HCI, help="Port to use")
+@click.option("--protocol", "-P", "protocol_name", default=DEFAULT_BT_PROTOCOL, help="Port to use",type=click.Choice(list(BTProtocol.__members__)))
+@click.option("--size", "-s", default=DEFAULT_BUFFER_SIZE, help="Length of packets to send")
+@click.option("--threads", "-t", default=VCORES_COUNT, help="Threads count to use")
+def deauth(target: str, port: int, protocol_name: str, size: int, threads: int):
+    protocol = BTProtocol[protocol_name]
+    
+    if protocol == BTProtocol.l2cap and is_windows():
+        logger.err("L2CAP protocol is not supported on Windows, please select RFCOMM using -P flag.")
+        sys.exit(1)
+    
+    logger.info("Initializing DeAuth attack...")
+    logger.info(f"  Target:         <lblue>{target}")
+    logger.info(f"  Port:           <lblue>{port}")
+    logger.info(f"  Protocol:       <lblue>{protocol.name}")
+    logger.info(f"  Packet size:    <lblue>{size}")
+    logger.info(f"  Threads:        <lblue>{threads}")
+    
+    from modules.deauth import deauth_async
+    deauth_async(target, port, protocol, size, threads)
+
+# Enum command
+@main.command()
+@click.argument("target", required=True, type=str)
+def enum(target: str):
+    from modules.enum import enum_services
+    enum_services(target)
+    
+# Random MAC
+@main.command()
+def random_mac():
+    from modules.random_mac import random_macs
+    random_macs()
@@ -1,8 +1,11 @@
+import re
+import sys
 from colorama import Fore
 
 ERR_PREFIX = f"{Fore.RED}ERR   {Fore.RESET}"
 WARN_PREFIX = f"{Fore.YELLOW}WARN  {Fore.RESET}"
 INFO_PREFIX = f"{Fore.CYAN}INFO  {Fore.RESET}"
+LINE_END = Fore.RESET
 HEADLESS = False
 
 def init_logger(headless: bool):
@@ -10,62 +13,65 @@ def init_logger(headless: bool):
     HEADLESS = headless
     
     if headless:
-        global ERR_PREFIX, WARN_PREFIX, INFO_PREFIX
+        global ERR_PREFIX, WARN_PREFIX, INFO_PREFIX, LINE_END, TAG_REPLACEMENT
+        LINE_END = ""
+        TAG_REPLACEMENT = ""
         ERR_PREFIX = "ERR "
         WARN_PREFIX = "WARN "
         INFO_PREFIX = "INFO "
         
-def strip_colors(message: str):
-    message = message.replace("<black>", "")
-    message = message.replace("<blue>", "")
-    message = message.replace("<cyan>", "")
-    message = message.replace("<green>", "")
-    message = message.replace("<magenta>", "")
-    message = message.replace("<red>", "")
-    message = message.replace("<white>", "")
-    message = message.replace("<yellow>", "")
-    message = message.replace("<lblack>", "")
-    message = message.replace("<lblue>", "")
-    message = message.replace("<lcyan>", "")
-    message = message.replace("<lgreen>", "")
-    message = message.replace("<lmagenta>", "")
-    message = message.replace("<lred>", "")
-    message = message.replace("<lwhite>", "")
-    message = message.replace("<lyellow>", "")
-    message = message.replace("<reset>", "")
-    return message
-        
+COLORS = {
+    "<black>": Fore.BLACK,
+    "<blue>": Fore.BLUE,
+    "<cyan>": Fore.CYAN,
+    "<green>": Fore.GREEN,
+    "<magenta>": Fore.MAGENTA,
+    "<red>": Fore.RED,
+    "<white>": Fore.WHITE,
+    "<yellow>": Fore.YELLOW,
+    "<lblack>": Fore.LIGHTBLACK_EX,
+    "<lblue>": Fore.LIGHTBLUE_EX,
+    "<lcyan>": Fore.LIGHTCYAN_EX,
+    "<lgreen>": Fore.LIGHTGREEN_EX,
+    "<lmagenta>": Fore.LIGHTMAGENTA_EX,
+    "<lred>": Fore.LIGHTRED_EX,
+    "<lwhite>": Fore.LIGHTWHITE_EX,
+    "<lyellow>": Fore.LIGHTYELLOW_EX,
+    "<reset>": Fore.RESET,
+}
+
+# Matches every color tag in a single pass.
+TAGS_PATTERN = re.compile("|".join(map(re.escape, COLORS)))
+
+def replace_color(match: re.Match):
+    return COLORS[match.group(0)]
+
+# Either a color lookup or an empty string in headless mode.
+TAG_REPLACEMENT = replace_color
+
 def format(message: str):
-    if HEADLESS:
-        return strip_colors(message)
+    # Reset colors at the end so they never leak into the next output.
+    return TAGS_PATTERN.sub(TAG_REPLACEMENT, message) + LINE_END
+        
+def log(prefix: str, message: str):
+    if HEADLESS and message == "": return
     
-    message = message.replace("<black>", Fore.BLACK)
-    message = message.replace("<blue>", Fore.BLUE)
-    message = message.replace("<cyan>", Fore.CYAN)
-    message = message.replace("<green>", Fore.GREEN)
-    message = message.replace("<magenta>", Fore.MAGENTA)
-    message = message.replace("<red>", Fore.RED)
-    message = message.replace("<white>", Fore.WHITE)
-    message = message.replace("<yellow>", Fore.YELLOW)
-    message = message.replace("<lblack>", Fore.LIGHTBLACK_EX)
-    message = message.replace("<lblue>", Fore.LIGHTBLUE_EX)
-    message = message.replace("<lcyan>", Fore.LIGHTCYAN_EX)
-    message = message.replace("<lgreen>", Fore.LIGHTGREEN_EX)
-    message = message.replace("<lmagenta>", Fore.LIGHTMAGENTA_EX)
-    message = message.replace("<lred>", Fore.LIGHTRED_EX)
-    message = message.replace("<lwhite>", Fore.LIGHTWHITE_EX)
-    message = message.replace("<lyellow>", Fore.LIGHTYELLOW_EX)
-    message = message.replace("<reset>", Fore.RESET)
-    return message
+    # Untagged messages need no formatting.
+    if "<" in message:
+        message = format(message)
+        
+    print(prefix + message)
         
 def err(message: str):
-    if HEADLESS and message == "": return
-    print(f"{ERR_PREFIX}{format(message)}")
+    log(ERR_PREFIX, message)
     
 def warn(message: str):
-    if HEADLESS and message == "": return
-    print(f"{WARN_PREFIX}{format(message)}")
+    log(WARN_PREFIX, message)
     
 def info(message: str): 
-    if HEADLESS and message == "": return
-    print(f"{INFO_PREFIX}{format(message)}")
\ No newline at end of file
+    log(INFO_PREFIX, message)
+    
+def info_bulk(messages: list):
+    # Write many lines at once, empty messages become blank lines.
+    lines = [INFO_PREFIX + format(message) if message else "" for message in messages]
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
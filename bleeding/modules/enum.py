@@ -9,7 +9,7 @@ def enum_services(device: str):
         logger.warn("No services found.")
         return
     
-    logger.info("Services found:")
+    lines = ["Services found:"]
     for service in services:
         name = service['name']
         
@@ -18,9 +18,11 @@ def enum_services(device: str):
         elif isinstance(name, bytes):
             name = name.decode('utf-8')
         
-        logger.info(f"> <cyan>{name}")
-        logger.info(f"    <lblack>* <reset>Description: <lgreen>{service['description']}")
-        logger.info(f"    <lblack>* <reset>Protocol: <lgreen>{service['protocol']}")
-        logger.info(f"    <lblack>* <reset>Provider: <lgreen>{service['provider']}")
-        logger.info(f"    <lblack>* <reset>Port: <lgreen>{service['port']}")
-        print("")
\ No newline at end of file
+        lines.append(f"> <cyan>{name}")
+        lines.append(f"    <lblack>* <reset>Description: <lgreen>{service['description']}")
+        lines.append(f"    <lblack>* <reset>Protocol: <lgreen>{service['protocol']}")
+        lines.append(f"    <lblack>* <reset>Provider: <lgreen>{service['provider']}")
+        lines.append(f"    <lblack>* <reset>Port: <lgreen>{service['port']}")
+        lines.append("")
+    
+    logger.info_bulk(lines)
\ No newline at end of file
@@ -0,0 +1,13 @@
+import logger
+
+from utils.mac_utils import random_mac_all_vendors
+
+def random_macs():
+    logger.info("Generating random MAC addresses...")
+    macs = random_mac_all_vendors()
+    
+    for mac in macs:
+        vendor = mac[0].ljust(10, " ")
+        addr = mac[1]
+        
+        logger.info(f" <lblack>* <reset>{vendor}\t<lgreen>{addr}")
\ No newline at end of file
@@ -1,37 +1,68 @@
 import logger
 import multiprocessing
+import queue
+import sys
 import time
 
+from multiprocessing.connection import wait
+
+def run_worker(func, args, errors):
+    # Report the exception back to the supervisor before the worker dies.
+    try:
+        func(*args)
+    except Exception as e:
+        errors.put(str(e))
+        sys.exit(1)
+
 def create_async_task(threads: int, func, args=()):
     logger.info("")
     logger.info(f"Starting thread pool with <cyan>{threads} workers...")
     time.sleep(1)
 
     error = None
+    errors = multiprocessing.Queue()
+    workers = []
     
-    def error_callback(e):
-        nonlocal error
-        if not error:
-            error = e
+    for worker_id in range(0, threads):
+        worker_args = args + (worker_id,)
+        worker_name = f"Worker-{worker_id:02d}"
+        worker = multiprocessing.Process(target=run_worker, args=(func, worker_args, errors), name=worker_name, daemon=True)
+        worker.start()
+        workers.append(worker)
     
-    with multiprocessing.Pool(processes=threads) as pool:
-        for worker_id in range(0, threads):
-            worker_args = args + (worker_id,)
-            pool.apply_async(func, args=worker_args, error_callback=lambda e: error_callback(e))
+    try:
+        running = workers
         
-        while True:
+        while running:
+            # Block until at least one worker exits.
             try:
-                time.sleep(1)
-                if error:
-                    break
+                ready = wait([worker.sentinel for worker in running])
             except KeyboardInterrupt:
                 break
+            
+            # Reap the exited workers so their exit codes are set.
+            exited = [worker for worker in running if worker.sentinel in ready]
+            for worker in exited:
+                worker.join()
+            
+            failed = [worker for worker in exited if worker.exitcode]
+            if failed:
+                error = f"{failed[0].name} exited with code {failed[0].exitcode}"
+                break
+            
+            running = [worker for worker in running if worker not in exited]
         
         if error:
-            logger.err(f"\nThread pool throws an exception: <lred>{error}")
-        
+            try:
+                logger.err(f"\nThread pool throws an exception: <lred>{errors.get_nowait()}")
+            except queue.Empty:
+                logger.err(f"\nThread pool stopped: <lred>{error}")
+    finally:
         logger.info("Stopping threads...")
-        pool.close()
-        pool.terminate()
-        pool.join()
-        exit(1)
\ No newline at end of file
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
+    
+    if error:
+        sys.exit(1)
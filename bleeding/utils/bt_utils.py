@@ -1,7 +1,7 @@
 from enum import Enum, unique
-import bluetooth
 
+# Values name the matching pybluez constants, resolved once bluetooth is imported.
 @unique
 class BTProtocol(Enum):
-    l2cap = bluetooth.L2CAP
-    rfcomm = bluetooth.RFCOMM
+    l2cap = "L2CAP"
+    rfcomm = "RFCOMM"
@@ -1,50 +1,44 @@
+import os
 import random
 
-MAC_MIN = 0x00
-MAC_MAX = 0xff
+VENDORS = (
+    ("acer", "C0:98:79"),
+    ("apple", "FC:FC:48"),
+    ("asus", "FC:C2:33"),
+    ("dell", "D8:D0:90"),
+    ("google", "F8:8F:CA"),
+    ("hp", "B0:5C:DA"),
+    ("htc", "98:0D:2E"),
+    ("intel", "FC:F8:AE"),
+    ("lenovo", "A4:8C:DB"),
+    ("lg", "F8:A9:D0"),
+    ("microsoft", "C4:9D:ED"),
+    ("motorola", "F8:F1:B6"),
+    ("samsung", "FC:F1:36"),
+    ("sony", "D4:38:9C"),
+    ("toshiba", "EC:21:E5"),
+    ("xiaomi", "FC:64:BA"),
+)
 
-VENDORS_OUI = {
-    "acer": "C0:98:79",
-    "apple": "FC:FC:48",
-    "asus": "FC:C2:33",
-    "dell": "D8:D0:90",
-    "google": "F8:8F:CA",
-    "hp": "B0:5C:DA",
-    "htc": "98:0D:2E",
-    "intel": "FC:F8:AE",
-    "lenovo": "A4:8C:DB",
-    "lg": "F8:A9:D0",
-    "microsoft": "C4:9D:ED",
-    "motorola": "F8:F1:B6",
-    "samsung": "FC:F1:36",
-    "sony": "D4:38:9C",
-    "toshiba": "EC:21:E5",
-    "xiaomi": "FC:64:BA",
-}
+VENDORS_OUI = dict(VENDORS)
+OUIS = tuple(VENDORS_OUI.values())
 
 def random_mac_head():
     # Generate first 3 bytes.
-    vendor = random.choice(list(VENDORS_OUI.values()))
-    return vendor
+    return random.choice(OUIS)
     
 def random_mac_tail():
-    # Generate last 3 bytes.
-    last_bytes = [random.randint(MAC_MIN, MAC_MAX) for _ in range(3)]
-    
-    # Set the 2nd least significant bit to 1 (locally administered).
-    return ':'.join(map(lambda x: format(x, '02x'), last_bytes))
+    # Generate last 3 bytes at once.
+    return os.urandom(3).hex(":")
+
+def random_mac_tails(count: int):
+    # Generate last 3 bytes for many addresses from a single read.
+    raw = os.urandom(3 * count)
+    return [raw[i:i + 3].hex(":") for i in range(0, 3 * count, 3)]
 
 def random_mac():
     return random_mac_head() + ":" + random_mac_tail()
 
 def random_mac_all_vendors():
-    vendors = list(VENDORS_OUI.keys())
-    macs = []
-    
-    for vendor in vendors:
-        head = VENDORS_OUI[vendor]
-        tail = random_mac_tail()
-        mac = head + ":" + tail
-        macs.append([vendor, mac])
-        
-    return macs
\ No newline at end of file
+    tails = random_mac_tails(len(VENDORS))
+    return [[vendor, head + ":" + tail] for (vendor, head), tail in zip(VENDORS, tails)]
\ No newline at end of file
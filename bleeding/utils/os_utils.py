@@ -1,25 +1,34 @@
+import functools
 import os
 import platform
 import subprocess
 
+@functools.lru_cache(maxsize=1)
 def get_vcores():
-    return os.cpu_count()
+    # Count only the cores this process may run on, where supported.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    
+    return os.cpu_count() or 1
 
+@functools.lru_cache(maxsize=1)
 def is_linux():
     return platform.system() == 'Linux'
 
+@functools.lru_cache(maxsize=1)
 def is_windows():
     return platform.system() == 'Windows'
 
 # Unused function
 def is_binary_installed(binary_name: str):
-    command = is_linux() and f"which {binary_name}" or f"where {binary_name}"
+    command = [is_linux() and "which" or "where", binary_name]
     try:
-        out = subprocess.check_output(command, shell=True, stderr=subprocess.STDOUT, timeout=10)
+        out = subprocess.check_output(command, stderr=subprocess.STDOUT, timeout=10)
         return out != b''
-    except subprocess.CalledProcessError as _:
+    except (subprocess.CalledProcessError, FileNotFoundError) as _:
         return False
 
+@functools.lru_cache(maxsize=1)
 def is_ble_supported():
     if is_linux():
         return True